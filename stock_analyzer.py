@@ -1,11 +1,83 @@
 import streamlit as st
-import yfinance as yf
-import pandas as pd
+import yfinance_cache as yf
+from yfinance_cache import yfc_cache_manager
 import plotly.graph_objects as go
+import plotly.io as pio
 import plotly.express as px
 from plotly.subplots import make_subplots
 from datetime import datetime, timedelta
 import numpy as np
+from numba import njit
+import pyarrow as pa
+import pyarrow.csv as pacsv
+from concurrent.futures import ThreadPoolExecutor
+import warnings
+
+# In-memory cache lifetimes; yfinance-cache keeps the persistent store on disk
+HISTORY_TTL = 900
+INFO_TTL = 86400
+
+# Concurrent fetching of multiple tickers
+MAX_WORKERS = 8
+FETCH_TIMEOUT = 30
+
+# Price charts switch to weekly bars above this many daily bars (5y and max),
+# and line traces switch to WebGL above the same number of points
+WEEKLY_RESAMPLE_THRESHOLD = 1000
+
+# Serialize figures with orjson and skip per-property validation: traces are
+# plain dicts passed straight to go.Figure(data=..., layout=..., _validate=False)
+# together with layouts prebuilt below. _validate is a private plotly kwarg
+# (present in 5.x and 6.x), hence the <7 pin in requirements.txt.
+pio.json.config.default_engine = 'orjson'
+# Unvalidated figures don't resolve template names, so pass the object itself
+PLOTLY_TEMPLATE = pio.templates['plotly_white']
+
+# Chart layouts and moving-average styles are constant, so build them once
+MARGIN = dict(l=50, r=50, t=50, b=50)
+
+def _subplot_layout(subplot_kwargs, axis_titles, **layout):
+    """Build a subplot grid layout once, as plain dicts, for unvalidated figures"""
+    fig = make_subplots(rows=2, cols=1, **subplot_kwargs)
+    fig.update_layout(**layout)
+    for axis, row, title in axis_titles:
+        getattr(fig, f'update_{axis}axes')(title_text=title, row=row, col=1)
+    return fig.to_dict()['layout']
+
+# Title annotations are filled in per ticker; see _with_titles
+PRICE_LAYOUT = _subplot_layout(
+    dict(shared_xaxes=True, vertical_spacing=0.03, row_heights=[0.7, 0.3],
+         subplot_titles=('Price', 'Volume')),
+    (('x', 2, 'Date'), ('y', 1, 'Price (USD)'), ('y', 2, 'Volume')),
+    height=600,
+    xaxis_rangeslider_visible=False,
+    hovermode='x unified',
+    template=PLOTLY_TEMPLATE,
+    margin=MARGIN
+)
+RETURNS_LAYOUT = _subplot_layout(
+    dict(vertical_spacing=0.15, subplot_titles=('Cumulative Returns', 'Daily Returns Distribution')),
+    (('x', 1, 'Date'), ('x', 2, 'Daily Return (%)'), ('y', 1, 'Return (%)'), ('y', 2, 'Frequency')),
+    height=500,
+    showlegend=False,
+    template=PLOTLY_TEMPLATE,
+    margin=MARGIN
+)
+VOLATILITY_LAYOUT = dict(
+    xaxis={'title': {'text': 'Date'}},
+    yaxis={'title': {'text': 'Volatility (%)'}},
+    height=350,
+    template=PLOTLY_TEMPLATE,
+    margin=MARGIN
+)
+MA_STYLES = (
+    ('MA_20', '#FFA726', '20-day MA'),
+    ('MA_50', '#42A5F5', '50-day MA'),
+    ('MA_200', '#AB47BC', '200-day MA')
+)
+
+# yfinance-cache keeps its incremental price/info store next to the app
+yfc_cache_manager.SetCacheDirpath(".yfc_cache")
 
 # Page configuration
 st.set_page_config(
@@ -47,9 +119,9 @@ with st.sidebar:
     
     # Stock ticker input
     ticker_input = st.text_input(
-        "Enter Stock Ticker or Company Name",
+        "Enter Stock Ticker(s) or Company Name",
         placeholder="e.g., AAPL, MSFT, Tesla",
-        help="Enter the stock ticker symbol (e.g., AAPL) or company name"
+        help="Enter one or more stock ticker symbols separated by commas (e.g., AAPL, MSFT)"
     )
     
     # Time period selection
@@ -68,174 +140,312 @@ with st.sidebar:
     
     analyze_button = st.button("🔍 Analyze Stock", type="primary", use_container_width=True)
 
+@st.cache_resource(show_spinner=False)
+def get_ticker(ticker):
+    """Return a yfinance Ticker shared across reruns and sessions"""
+    return yf.Ticker(ticker)
+
+@st.cache_data(ttl=HISTORY_TTL, show_spinner=False)
+def get_history(ticker, period):
+    """Fetch price history"""
+    return get_ticker(ticker).history(period=period)
+
+@st.cache_data(ttl=INFO_TTL, show_spinner=False)
+def get_info(ticker):
+    """Fetch company info, which changes far less often than prices"""
+    return get_ticker(ticker).info
+
 def get_stock_data(ticker, period):
     """Fetch stock data using yfinance"""
     try:
-        stock = yf.Ticker(ticker)
-        hist = stock.history(period=period)
-        info = stock.info
-        return stock, hist, info
+        hist = get_history(ticker, period)
+    except Exception as e:
+        warnings.warn(f"Failed to fetch data for {ticker}: {e}")
+        return None, None
+    
+    # Yahoo's info endpoint fails more often than history; still show the prices
+    try:
+        info = get_info(ticker)
     except Exception as e:
-        return None, None, None
+        warnings.warn(f"Failed to fetch company info for {ticker}: {e}")
+        info = None
+    return hist, info
+
+def fetch_many(tickers, period):
+    """Fetch stock data for several tickers concurrently"""
+    results = {}
+    executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+    try:
+        futures = {ticker: executor.submit(get_stock_data, ticker, period) for ticker in tickers}
+        for ticker, future in futures.items():
+            try:
+                results[ticker] = future.result(timeout=FETCH_TIMEOUT)
+            except Exception as e:
+                warnings.warn(f"Timed out fetching data for {ticker}: {e}")
+                results[ticker] = (None, None)
+    finally:
+        # Don't block the page on requests that already timed out
+        executor.shutdown(wait=False, cancel_futures=True)
+    return results
+
+@njit(cache=True)
+def _slide_sum(values, i, window, total, nans):
+    """Add values[i] to a running window sum and drop the value leaving it"""
+    x = values[i]
+    if np.isnan(x):
+        nans += 1
+    else:
+        total += x
+    if i >= window:
+        old = values[i - window]
+        if np.isnan(old):
+            nans -= 1
+        else:
+            total -= old
+    return total, nans
+
+@njit(cache=True)
+def _slide_sum_sq(values, i, window, total, total_sq, nans):
+    """Like _slide_sum, also keeping a running sum of squares"""
+    x = values[i]
+    if np.isnan(x):
+        nans += 1
+    else:
+        total += x
+        total_sq += x * x
+    if i >= window:
+        old = values[i - window]
+        if np.isnan(old):
+            nans -= 1
+        else:
+            total -= old
+            total_sq -= old * old
+    return total, total_sq, nans
+
+@njit(cache=True)
+def _fused_rolling(close, returns):
+    """Compute the 20/50/200-day moving averages and 20-day return std in one pass"""
+    n = close.shape[0]
+    ma_20 = np.full(n, np.nan)
+    ma_50 = np.full(n, np.nan)
+    ma_200 = np.full(n, np.nan)
+    std_20 = np.full(n, np.nan)
+    
+    s20 = s50 = s200 = r_sum = r_sq = 0.0
+    k20 = k50 = k200 = r_nans = 0
+    for i in range(n):
+        s20, k20 = _slide_sum(close, i, 20, s20, k20)
+        s50, k50 = _slide_sum(close, i, 50, s50, k50)
+        s200, k200 = _slide_sum(close, i, 200, s200, k200)
+        r_sum, r_sq, r_nans = _slide_sum_sq(returns, i, 20, r_sum, r_sq, r_nans)
+        
+        if i >= 19 and k20 == 0:
+            ma_20[i] = s20 / 20
+        if i >= 49 and k50 == 0:
+            ma_50[i] = s50 / 50
+        if i >= 199 and k200 == 0:
+            ma_200[i] = s200 / 200
+        if i >= 19 and r_nans == 0:
+            var = (r_sq - r_sum * r_sum / 20) / 19
+            std_20[i] = np.sqrt(var) if var > 0 else 0.0
+    
+    return ma_20, ma_50, ma_200, std_20
+
+@njit(cache=True)
+def _describe(values):
+    """Return the mean, sample std, min and max of the non-NaN values in one pass"""
+    n = 0
+    total = total_sq = 0.0
+    low = np.inf
+    high = -np.inf
+    for x in values:
+        if np.isnan(x):
+            continue
+        n += 1
+        total += x
+        total_sq += x * x
+        low = min(low, x)
+        high = max(high, x)
+    
+    if n == 0:
+        return np.nan, np.nan, np.nan, np.nan
+    mean = total / n
+    std = np.nan
+    if n > 1:
+        var = (total_sq - total * total / n) / (n - 1)
+        std = np.sqrt(var) if var > 0 else 0.0
+    return mean, std, low, high
 
 def calculate_metrics(df):
     """Calculate key financial metrics"""
     if df.empty:
         return None
     
-    # Calculate returns
-    df['Daily_Return'] = df['Close'].pct_change()
-    df['Cumulative_Return'] = (1 + df['Daily_Return']).cumprod() - 1
-    
-    # Calculate moving averages
-    df['MA_20'] = df['Close'].rolling(window=20).mean()
-    df['MA_50'] = df['Close'].rolling(window=50).mean()
-    df['MA_200'] = df['Close'].rolling(window=200).mean()
+    close = df['Close'].to_numpy(dtype=np.float64)
     
-    # Calculate volatility
-    df['Volatility'] = df['Daily_Return'].rolling(window=20).std() * np.sqrt(252)
+    # Calculate returns
+    returns = np.empty_like(close)
+    returns[0] = np.nan
+    np.divide(close[1:], close[:-1], out=returns[1:])
+    returns[1:] -= 1
+    df['Daily_Return'] = returns
+    
+    cumulative = np.empty_like(close)
+    cumulative[0] = 0.0
+    np.cumprod(1.0 + np.nan_to_num(returns[1:]), out=cumulative[1:])
+    cumulative[1:] -= 1
+    df['Cumulative_Return'] = cumulative
+    
+    # Calculate moving averages and volatility in a single fused pass
+    ma_20, ma_50, ma_200, std_20 = _fused_rolling(close, returns)
+    df['MA_20'] = ma_20
+    df['MA_50'] = ma_50
+    df['MA_200'] = ma_200
+    df['Volatility'] = std_20 * np.sqrt(252)
     
     return df
 
+def downcast_for_charts(df):
+    """Return a copy with float32 price and metric columns for plotting"""
+    # float32 is plenty for display and halves the chart payload sent to the browser
+    float_columns = ['Open', 'High', 'Low', 'Close', 'MA_20', 'MA_50', 'MA_200',
+                     'Volatility', 'Daily_Return', 'Cumulative_Return']
+    return df.astype({c: np.float32 for c in float_columns})
+
+@st.cache_data(ttl=HISTORY_TTL, show_spinner=False)
+def chart_metrics(ticker, period):
+    """float32 copy of the metrics for plotting, cached per ticker and period"""
+    return downcast_for_charts(compute_metrics(ticker, period))
+
+@st.cache_data(ttl=HISTORY_TTL, show_spinner=False)
+def compute_metrics(ticker, period):
+    """Fetch price history and calculate metrics, cached per ticker and period"""
+    return calculate_metrics(get_history(ticker, period))
+
+@st.cache_data(ttl=HISTORY_TTL, show_spinner=False)
+def export_csv(ticker, period):
+    """Serialize the analyzed data to CSV bytes with PyArrow, cached per ticker and period"""
+    df = compute_metrics(ticker, period).reset_index()
+    # Keep dates in the text form pandas' to_csv used, e.g. 2019-01-01 00:00:00-05:00
+    df[df.columns[0]] = df[df.columns[0]].astype(str)
+    
+    # Write an unquoted header ourselves; values need no quoting either
+    buf = pa.BufferOutputStream()
+    buf.write((",".join(df.columns) + "\n").encode())
+    pacsv.write_csv(
+        pa.Table.from_pandas(df, preserve_index=False), buf,
+        pacsv.WriteOptions(include_header=False, quoting_style='none')
+    )
+    return buf.getvalue().to_pybytes()
+
+def resample_weekly(df):
+    """Downsample daily bars to weekly bars for plotting long histories"""
+    agg = {'Open': 'first', 'High': 'max', 'Low': 'min', 'Close': 'last', 'Volume': 'sum'}
+    agg.update({ma: 'last' for ma in ('MA_20', 'MA_50', 'MA_200') if ma in df.columns})
+    return df.resample('W').agg(agg).dropna(subset=['Close'])
+
+def line_trace_type(n_points):
+    """Use WebGL only for long series; browsers cap the number of live WebGL contexts"""
+    return 'scattergl' if n_points > WEEKLY_RESAMPLE_THRESHOLD else 'scatter'
+
+def _with_titles(layout, *titles):
+    """Return a copy of a prebuilt subplot layout with new subplot titles"""
+    annotations = [dict(a, text=t) for a, t in zip(layout['annotations'], titles)]
+    return dict(layout, annotations=annotations)
+
 def create_price_chart(df, ticker, show_ma):
     """Create interactive price chart with moving averages"""
-    fig = make_subplots(
-        rows=2, cols=1,
-        shared_xaxes=True,
-        vertical_spacing=0.03,
-        row_heights=[0.7, 0.3],
-        subplot_titles=(f'{ticker} Stock Price', 'Volume')
-    )
+    title = f'{ticker} Stock Price'
+    if len(df) > WEEKLY_RESAMPLE_THRESHOLD:
+        df = resample_weekly(df)
+        title += ' (Weekly)'
     
     # Candlestick chart
-    fig.add_trace(
-        go.Candlestick(
-            x=df.index,
-            open=df['Open'],
-            high=df['High'],
-            low=df['Low'],
-            close=df['Close'],
-            name='Price',
-            increasing_line_color='#26a69a',
-            decreasing_line_color='#ef5350'
-        ),
-        row=1, col=1
-    )
-    
-    # Moving averages
-    if show_ma:
-        colors = {'MA_20': '#FFA726', 'MA_50': '#42A5F5', 'MA_200': '#AB47BC'}
-        names = {'MA_20': '20-day MA', 'MA_50': '50-day MA', 'MA_200': '200-day MA'}
-        
-        for ma, color in colors.items():
-            if ma in df.columns:
-                fig.add_trace(
-                    go.Scatter(
-                        x=df.index,
-                        y=df[ma],
-                        name=names[ma],
-                        line=dict(color=color, width=2)
-                    ),
-                    row=1, col=1
-                )
+    traces = [{
+        'type': 'candlestick',
+        'x': df.index,
+        'open': df['Open'].values,
+        'high': df['High'].values,
+        'low': df['Low'].values,
+        'close': df['Close'].values,
+        'name': 'Price',
+        'increasing': {'line': {'color': '#26a69a'}},
+        'decreasing': {'line': {'color': '#ef5350'}},
+        'xaxis': 'x', 'yaxis': 'y'
+    }]
+    
+    # Moving averages (always added so toggling them only flips visibility)
+    for ma, color, name in MA_STYLES:
+        if ma in df.columns:
+            traces.append({
+                'type': line_trace_type(len(df)),
+                'x': df.index,
+                'y': df[ma].values,
+                'name': name,
+                'line': {'color': color, 'width': 2},
+                'visible': show_ma,
+                'xaxis': 'x', 'yaxis': 'y'
+            })
     
     # Volume bars
-    colors = ['#ef5350' if row['Close'] < row['Open'] else '#26a69a' 
-              for _, row in df.iterrows()]
-    
-    fig.add_trace(
-        go.Bar(
-            x=df.index,
-            y=df['Volume'],
-            name='Volume',
-            marker_color=colors,
-            showlegend=False
-        ),
-        row=2, col=1
-    )
-    
-    fig.update_layout(
-        height=600,
-        xaxis_rangeslider_visible=False,
-        hovermode='x unified',
-        template='plotly_white',
-        margin=dict(l=50, r=50, t=50, b=50)
-    )
-    
-    fig.update_xaxes(title_text="Date", row=2, col=1)
-    fig.update_yaxes(title_text="Price (USD)", row=1, col=1)
-    fig.update_yaxes(title_text="Volume", row=2, col=1)
-    
-    return fig
+    colors = np.where(df['Close'].values < df['Open'].values, '#ef5350', '#26a69a').tolist()
+    
+    traces.append({
+        'type': 'bar',
+        'x': df.index,
+        'y': df['Volume'].values,
+        'name': 'Volume',
+        'marker': {'color': colors},
+        'showlegend': False,
+        'xaxis': 'x2', 'yaxis': 'y2'
+    })
+    
+    return go.Figure(data=traces, layout=_with_titles(PRICE_LAYOUT, title, 'Volume'), _validate=False)
 
 def create_returns_chart(df, ticker):
     """Create returns analysis chart"""
-    fig = make_subplots(
-        rows=2, cols=1,
-        subplot_titles=(f'{ticker} Cumulative Returns', 'Daily Returns Distribution'),
-        vertical_spacing=0.15
-    )
-    
     # Cumulative returns
-    fig.add_trace(
-        go.Scatter(
-            x=df.index,
-            y=df['Cumulative_Return'] * 100,
-            name='Cumulative Return',
-            line=dict(color='#1f77b4', width=2),
-            fill='tozeroy',
-            fillcolor='rgba(31, 119, 180, 0.2)'
-        ),
-        row=1, col=1
-    )
-    
-    # Returns distribution
-    fig.add_trace(
-        go.Histogram(
-            x=df['Daily_Return'] * 100,
-            name='Daily Returns',
-            marker_color='#ff7f0e',
-            nbinsx=50
-        ),
-        row=2, col=1
-    )
-    
-    fig.update_xaxes(title_text="Date", row=1, col=1)
-    fig.update_xaxes(title_text="Daily Return (%)", row=2, col=1)
-    fig.update_yaxes(title_text="Return (%)", row=1, col=1)
-    fig.update_yaxes(title_text="Frequency", row=2, col=1)
+    cumulative = {
+        'type': line_trace_type(len(df)),
+        'x': df.index,
+        'y': df['Cumulative_Return'].values * 100,
+        'name': 'Cumulative Return',
+        'line': {'color': '#1f77b4', 'width': 2},
+        'fill': 'tozeroy',
+        'fillcolor': 'rgba(31, 119, 180, 0.2)',
+        'xaxis': 'x', 'yaxis': 'y'
+    }
     
-    fig.update_layout(
-        height=500,
-        showlegend=False,
-        template='plotly_white',
-        margin=dict(l=50, r=50, t=50, b=50)
-    )
+    # Returns distribution, binned here so only the 50 bars are sent to the browser
+    returns = df['Daily_Return'].to_numpy()
+    counts, edges = np.histogram(returns[~np.isnan(returns)] * 100, bins=50)
+    distribution = {
+        'type': 'bar',
+        'x': (edges[:-1] + edges[1:]) / 2,
+        'y': counts,
+        'width': np.diff(edges),
+        'name': 'Daily Returns',
+        'marker': {'color': '#ff7f0e'},
+        'xaxis': 'x2', 'yaxis': 'y2'
+    }
     
-    return fig
+    layout = _with_titles(RETURNS_LAYOUT, f'{ticker} Cumulative Returns', 'Daily Returns Distribution')
+    return go.Figure(data=[cumulative, distribution], layout=layout, _validate=False)
 
 def create_volatility_chart(df, ticker):
     """Create volatility analysis chart"""
-    fig = go.Figure()
-    
-    fig.add_trace(
-        go.Scatter(
-            x=df.index,
-            y=df['Volatility'] * 100,
-            name='20-day Volatility',
-            line=dict(color='#d62728', width=2),
-            fill='tozeroy',
-            fillcolor='rgba(214, 39, 40, 0.2)'
-        )
-    )
-    
-    fig.update_layout(
-        title=f'{ticker} Rolling Volatility (20-day)',
-        xaxis_title='Date',
-        yaxis_title='Volatility (%)',
-        height=350,
-        template='plotly_white',
-        margin=dict(l=50, r=50, t=50, b=50)
+    fig = go.Figure(
+        data=[{
+            'type': line_trace_type(len(df)),
+            'x': df.index,
+            'y': df['Volatility'].values * 100,
+            'name': '20-day Volatility',
+            'line': {'color': '#d62728', 'width': 2},
+            'fill': 'tozeroy',
+            'fillcolor': 'rgba(214, 39, 40, 0.2)'
+        }],
+        layout=dict(VOLATILITY_LAYOUT, title={'text': f'{ticker} Rolling Volatility (20-day)'}),
+        _validate=False
     )
     
     return fig
@@ -244,13 +454,14 @@ def display_key_metrics(df, info):
     """Display key financial metrics"""
     col1, col2, col3, col4 = st.columns(4)
     
-    current_price = df['Close'].iloc[-1]
-    price_change = df['Close'].iloc[-1] - df['Close'].iloc[-2]
-    price_change_pct = (price_change / df['Close'].iloc[-2]) * 100
+    close = df['Close'].to_numpy()
+    current_price, previous_price = close[-1], close[-2]
+    price_change = current_price - previous_price
+    price_change_pct = (price_change / previous_price) * 100
     
-    total_return = ((df['Close'].iloc[-1] - df['Close'].iloc[0]) / df['Close'].iloc[0]) * 100
-    avg_volume = df['Volume'].mean()
-    volatility = df['Volatility'].iloc[-1] * 100 if 'Volatility' in df.columns else 0
+    total_return = ((current_price - close[0]) / close[0]) * 100
+    avg_volume = df['Volume'].to_numpy().mean()
+    volatility = df['Volatility'].to_numpy()[-1] * 100 if 'Volatility' in df.columns else 0
     
     with col1:
         st.metric(
@@ -305,77 +516,112 @@ def display_company_info(info):
         if 'beta' in info:
             st.write(f"**Beta:** {info.get('beta', 'N/A')}")
 
-# Main application logic
-if analyze_button and ticker_input:
-    with st.spinner(f"Fetching data for {ticker_input}..."):
-        stock, hist_data, stock_info = get_stock_data(ticker_input.upper(), time_period)
+def get_price_chart(df, ticker, period, show_ma):
+    """Return the session's price chart for ticker/period, only updating MA visibility"""
+    price_figs = st.session_state.setdefault('price_figs', {})
+    # Rebuild when the cached metrics have been refreshed with new bars
+    fingerprint = (len(df), df.index[-1])
+    cached = price_figs.get((ticker, period))
+    if cached is None or cached[0] != fingerprint:
+        fig = create_price_chart(df, ticker, show_ma)
+        price_figs[(ticker, period)] = (fingerprint, fig)
+    else:
+        fig = cached[1]
+        ma_names = {name for _, _, name in MA_STYLES}
+        fig.update_traces(selector=lambda trace: trace.name in ma_names, visible=show_ma)
+    return fig
+
+def display_analysis(ticker, period, hist_data, stock_info):
+    """Display the full analysis for a single ticker"""
+    if hist_data is not None and not hist_data.empty:
+        # Calculate metrics (cached, so toggling options doesn't recompute them)
+        hist_data = compute_metrics(ticker, period)
         
-        if hist_data is not None and not hist_data.empty:
-            # Calculate metrics
-            hist_data = calculate_metrics(hist_data)
-            
-            # Display company information
-            if stock_info:
-                display_company_info(stock_info)
-                st.divider()
-            
-            # Display key metrics
-            st.subheader("📈 Key Metrics")
-            display_key_metrics(hist_data, stock_info)
+        # Display company information
+        if stock_info:
+            display_company_info(stock_info)
             st.divider()
-            
-            # Price chart
-            st.subheader("💹 Price Analysis")
-            price_fig = create_price_chart(hist_data, ticker_input.upper(), show_ma)
-            st.plotly_chart(price_fig, use_container_width=True)
-            
-            # Returns analysis
-            if show_returns:
-                st.divider()
-                st.subheader("📊 Returns Analysis")
-                returns_fig = create_returns_chart(hist_data, ticker_input.upper())
-                st.plotly_chart(returns_fig, use_container_width=True)
+        
+        # Display key metrics
+        st.subheader("📈 Key Metrics")
+        display_key_metrics(hist_data, stock_info)
+        st.divider()
+        
+        # Price chart
+        st.subheader("💹 Price Analysis")
+        chart_data = chart_metrics(ticker, period)
+        price_fig = get_price_chart(chart_data, ticker, period, show_ma)
+        st.plotly_chart(price_fig, use_container_width=True, key=f"{ticker}_price")
+        
+        # Returns analysis
+        if show_returns:
+            st.divider()
+            st.subheader("📊 Returns Analysis")
+            returns_fig = create_returns_chart(chart_data, ticker)
+            st.plotly_chart(returns_fig, use_container_width=True)
             
             # Volatility analysis
-            if show_returns:
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    volatility_fig = create_volatility_chart(hist_data, ticker_input.upper())
-                    st.plotly_chart(volatility_fig, use_container_width=True)
-                
-                with col2:
-                    st.subheader("📉 Statistical Summary")
-                    summary_stats = pd.DataFrame({
-                        'Metric': ['Mean Return', 'Std Deviation', 'Min Return', 'Max Return', 'Sharpe Ratio (approx)'],
-                        'Value': [
-                            f"{hist_data['Daily_Return'].mean() * 100:.4f}%",
-                            f"{hist_data['Daily_Return'].std() * 100:.4f}%",
-                            f"{hist_data['Daily_Return'].min() * 100:.2f}%",
-                            f"{hist_data['Daily_Return'].max() * 100:.2f}%",
-                            f"{(hist_data['Daily_Return'].mean() / hist_data['Daily_Return'].std() * np.sqrt(252)):.2f}"
-                        ]
-                    })
-                    st.dataframe(summary_stats, hide_index=True, use_container_width=True)
+            col1, col2 = st.columns(2)
             
-            # Download data option
-            st.divider()
-            st.subheader("💾 Export Data")
-            csv = hist_data.to_csv()
-            st.download_button(
-                label="📥 Download Historical Data (CSV)",
-                data=csv,
-                file_name=f"{ticker_input}_{time_period}_data.csv",
-                mime="text/csv"
-            )
+            with col1:
+                volatility_fig = create_volatility_chart(chart_data, ticker)
+                st.plotly_chart(volatility_fig, use_container_width=True)
             
-        else:
-            st.error(f"❌ Unable to fetch data for '{ticker_input}'. Please check the ticker symbol and try again.")
-            st.info("💡 **Tip:** Try using the official stock ticker symbol (e.g., AAPL for Apple, MSFT for Microsoft)")
+            with col2:
+                st.subheader("📉 Statistical Summary")
+                mean_return, std_return, min_return, max_return = _describe(
+                    hist_data['Daily_Return'].to_numpy(dtype=np.float64)
+                )
+                summary_stats = [
+                    ('Mean Return', f"{mean_return * 100:.4f}%"),
+                    ('Std Deviation', f"{std_return * 100:.4f}%"),
+                    ('Min Return', f"{min_return * 100:.2f}%"),
+                    ('Max Return', f"{max_return * 100:.2f}%"),
+                    ('Sharpe Ratio (approx)',
+                     f"{mean_return / std_return * np.sqrt(252):.2f}" if std_return > 0 else "N/A")
+                ]
+                st.markdown(
+                    "| Metric | Value |\n| --- | --- |\n" +
+                    "\n".join(f"| {metric} | {value} |" for metric, value in summary_stats)
+                )
+        
+        # Download data option
+        st.divider()
+        st.subheader("💾 Export Data")
+        csv = export_csv(ticker, period)
+        st.download_button(
+            label="📥 Download Historical Data (CSV)",
+            data=csv,
+            file_name=f"{ticker}_{period}_data.csv",
+            mime="text/csv"
+        )
+        
+    else:
+        st.error(f"❌ Unable to fetch data for '{ticker}'. Please check the ticker symbol and try again.")
+        st.info("💡 **Tip:** Try using the official stock ticker symbol (e.g., AAPL for Apple, MSFT for Microsoft)")
 
-elif analyze_button and not ticker_input:
+# Main application logic
+tickers = list(dict.fromkeys(filter(None, (t.strip().upper() for t in ticker_input.split(',')))))
+
+if analyze_button and tickers:
+    # Remember the analysis so toggling options rerenders it without another click
+    st.session_state.analysis = (tickers, time_period)
+    st.session_state.price_figs = {}
+elif analyze_button and not tickers:
+    st.session_state.pop('analysis', None)
     st.warning("⚠️ Please enter a stock ticker or company name to begin analysis.")
 
+if 'analysis' in st.session_state:
+    analyzed_tickers, analyzed_period = st.session_state.analysis
+    with st.spinner(f"Fetching data for {', '.join(analyzed_tickers)}..."):
+        results = fetch_many(analyzed_tickers, analyzed_period)
+    
+    tabs = st.tabs(analyzed_tickers) if len(analyzed_tickers) > 1 else [st.container()]
+    for ticker, tab in zip(analyzed_tickers, tabs):
+        with tab:
+            hist_data, stock_info = results[ticker]
+            display_analysis(ticker, analyzed_period, hist_data, stock_info)
+
 # Footer
 st.divider()
 st.markdown("""